@@ -1,13 +1,191 @@
-import textwrap
+import mmap
+import os.path
+from functools import lru_cache
+from math import gcd
 from typing import Callable, Optional
 
+# numpy is optional: when present, ciphers whose substitution varies per
+# position (TabulaRecta, Vigenere, AutoKey) get vectorized fast paths;
+# everything still works without it
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# numba is likewise optional: it compiles the loop that cannot be
+# vectorized (AutoKey decryption, whose key depends on its own output)
+# and a parallel substitution kernel for very large buffers
+try:
+    import numba
+except ImportError:
+    numba = None
+
 ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
 
+# the alphabet as bytes, encoded once for the table builders
+_ALPHABET_BYTES = ALPHABET.encode('ascii')
+
+# constant-time replacement for ALPHABET.index(): maps a character's byte
+# value straight to its 0-25 letter index, instead of scanning the alphabet
+# string. Non-letters map to 0; callers only look up normalized A-Z input.
+_ALPHA_INDEX = bytes(i - 65 if 65 <= i <= 90 else 0 for i in range(256))
+
+# every byte value that is not an uppercase letter, used to delete
+# non-letter bytes in a single translate pass after upper-casing
+_NON_UPPER = bytes(i for i in range(256) if not 65 <= i <= 90)
+
+# every byte value that is not a letter of either case, used as the delete
+# argument of the fused normalize-and-encrypt translate pass
+_NON_LETTER = bytes(i for i in range(256)
+                    if not (65 <= i <= 90 or 97 <= i <= 122))
+
+# sizes for streaming file processing: how much is read per iteration and
+# how large the write-side buffer is (amortizes syscalls per chunk)
+_CHUNK_SIZE = 1 << 16
+_FILE_BUFFERING = 1 << 20
+
+# below this many characters the numpy fast paths are not worth their
+# fixed per-call setup (buffer wrapping, dtype conversion) and the pure
+# Python loop wins; comfortably above the measured crossover
+_VECTOR_MIN = 1 << 10
+
+# bytes.translate is already a memory-bound C loop, so fanning the
+# substitution out across cores only pays off once the buffer is large
+# enough to amortize the thread dispatch
+_PARALLEL_MIN = 1 << 20
+
+def _writeWrapped(outputFile, data: bytes, col: int = 0, width: int = 80) -> int:
+    """
+    Writes data to outputFile inserting a newline every width bytes, in a
+    single pass with no intermediate copy of the whole output. col is the
+    current column position, carried across calls when streaming chunks;
+    returns the updated column for the next call.
+    """
+    pos = 0
+    end = len(data)
+    # slicing a memoryview shares the buffer, so each line written is a
+    # zero-copy window rather than a fresh bytes object
+    view = memoryview(data)
+    while pos < end:
+        take = min(width - col, end - pos)
+        outputFile.write(view[pos:pos + take])
+        pos += take
+        col += take
+        if col == width:
+            outputFile.write(b'\n')
+            col = 0
+    return col
+
+@lru_cache(maxsize=len(ALPHABET))
+def _caesarTables(shift: int) -> tuple:
+    """
+    Builds the shifted alphabet and the four translation tables for a
+    Caesar shift: encrypt/decrypt over normalized text plus the fused
+    variants that also fold case and non-letter handling into the same
+    pass. Cached because there are only 26 distinct shifts and workloads
+    like key sweeps construct the same ciphers over and over.
+    """
+    # slice and rejoin at shift index
+    # alphabet restarts with A after Z
+    alpha = ALPHABET[shift:] + ALPHABET[:shift]
+    plainBytes = _ALPHABET_BYTES
+    cipherBytes = alpha.encode('ascii')
+    encTable = bytes.maketrans(plainBytes, cipherBytes)
+    decTable = bytes.maketrans(cipherBytes, plainBytes)
+    # fused tables: either case maps straight to the output letter
+    fusedEncTable = bytes.maketrans(
+        (ALPHABET + ALPHABET.lower()).encode('ascii'), cipherBytes * 2)
+    fusedDecTable = bytes.maketrans(
+        (alpha + alpha.lower()).encode('ascii'), plainBytes * 2)
+    return alpha, encTable, decTable, fusedEncTable, fusedDecTable
+
+def _substitute(data: bytes, table: bytes) -> bytes:
+    """
+    The shared substitution kernel: maps every byte of data through a
+    256-entry translation table in a single C-level pass. All fixed-table
+    cipher paths funnel through this one call. Very large buffers are
+    handed to the compiled parallel kernel when numba is installed.
+    """
+    if numba is not None and len(data) >= _PARALLEL_MIN:
+        buf = numpy.frombuffer(data, dtype=numpy.uint8)
+        tableArr = numpy.frombuffer(table, dtype=numpy.uint8)
+        out = numpy.empty(buf.size, dtype=numpy.uint8)
+        _substituteKernel(buf, tableArr, out)
+        return out.tobytes()
+    return data.translate(table)
+
+def _shiftByKey(text: str, key: str, sign: int) -> str:
+    """
+    Shifts every letter of text by the letter of key at the same position,
+    cycling the key when it is shorter than the text. sign is +1 to encrypt
+    and -1 to decrypt. Both strings must already be normalized to A-Z.
+    Used by the key-driven ciphers (Vigenere, AutoKey).
+    """
+    if numpy is not None and len(text) >= _VECTOR_MIN:
+        # the whole transform is elementwise modular arithmetic, so it
+        # vectorizes: no Python bytecode runs per character
+        t = numpy.frombuffer(text.encode('ascii'), dtype=numpy.uint8).astype(numpy.int16)
+        k = numpy.frombuffer(key.encode('ascii'), dtype=numpy.uint8).astype(numpy.int16)
+        k = numpy.resize(k, t.size) # tile or truncate the key to fit
+        # the two -65 offsets cancel out modulo 26, so the raw byte values
+        # can be combined directly
+        out = ((t + sign * k) % 26 + 65).astype(numpy.uint8)
+        return out.tobytes().decode('ascii')
+
+    keyLength = len(key)
+    newChars = []
+    for i, char in enumerate(text):
+        index = (ord(char) + sign * ord(key[i % keyLength])) % 26
+        newChars.append(ALPHABET[index])
+    return ''.join(newChars)
+
+if numba is not None:
+    @numba.njit(parallel=True, cache=True, boundscheck=False)
+    def _substituteKernel(data, table, out):
+        """
+        Compiled parallel substitution: out[i] = table[data[i]] split
+        across cores. The substitution is embarrassingly parallel, which
+        bytes.translate cannot exploit while it holds the GIL.
+        """
+        for i in numba.prange(data.shape[0]):
+            out[i] = table[data[i]]
+
+    @numba.njit(cache=True, boundscheck=False)
+    def _autokeyDecryptKernel(data, primer, out):
+        """
+        Compiled AutoKey decryption loop. The key for each position is the
+        primer at the start, then the cipher's own earlier output, so the
+        loop is inherently sequential; compiling it removes the interpreter
+        cost per character. All arrays hold raw letter byte values (65-90)
+        as int16 so the subtraction cannot underflow.
+        """
+        primerLength = primer.shape[0]
+        for i in range(data.shape[0]):
+            if i < primerLength:
+                k = primer[i]
+            else:
+                k = out[i - primerLength]
+            # the two letter offsets cancel out modulo 26
+            out[i] = (data[i] - k) % 26 + 65
+
 class Cipher:
     """
     Base class for a generic cipher. Provides useful functions across multiple
     cipher types.
     """
+    # True when encryptRaw/decryptRaw are stateless per byte, letting
+    # processFile work through the file in fixed-size chunks instead of
+    # reading it whole. Ciphers that carry state across characters
+    # (a rotating alphabet or running key) leave this False.
+    streamable = False
+
+    # fixed-table ciphers can additionally provide fused tables mapping
+    # letters of either case straight to the output letter; combined with
+    # _NON_LETTER as the delete argument, normalization and encryption then
+    # collapse into one translate pass on the file path
+    _fusedEncTable = None
+    _fusedDecTable = None
+
     @staticmethod
     def normalizeText(func: Callable) -> Callable:
         """
@@ -15,16 +193,32 @@ class Cipher:
         characters in upper case. Used for the encrypt/decrypt Text methods.
         """
         def wrapper(self, text: str, *args, **kwargs) -> str:
-            # transform each character in text to an uppercase letter
-            normalText = ""
-            for char in text:
-                if char.isalpha(): # do not include non-letter characters
-                    normalText += char.upper()
-
             # input text for the function is only capital letters
-            return func(self, normalText, *args, **kwargs)
+            return func(self, Cipher.normalizeString(text), *args, **kwargs)
         return wrapper
 
+    @staticmethod
+    def normalizeString(text: str) -> str:
+        """
+        String counterpart of normalizeRaw: returns only the uppercase
+        letters A-Z. Backs the normalizeText decorator and is also used on
+        keys and primers that arrive as arbitrary text.
+        """
+        # route through the bytes normalizer: encode, upper, and translate
+        # are each whole-buffer C passes, with no Python predicate call
+        # per character
+        return Cipher.normalizeRaw(text.encode('ascii', 'ignore')).decode('ascii')
+
+    @staticmethod
+    def normalizeRaw(data: bytes) -> bytes:
+        """
+        Bytes counterpart of normalizeText. Takes raw file bytes and returns
+        only the uppercase letters A-Z. Used for the file processing path so
+        files never pay the UTF-8 decode/encode round trip.
+        """
+        # upper() and translate() are both single C-level passes
+        return data.upper().translate(None, _NON_UPPER)
+
     @staticmethod
     def constructFilePath(func: Callable) -> Callable:
         """
@@ -36,8 +230,9 @@ class Cipher:
                     outputFilePath: str = None,
                     mode: str = 'E', *args, **kwargs) -> str:
             if not outputFilePath:
-                # separate the name from the extension
-                temp = inputFilePath.split('.')
+                # separate the name from the extension; splitext handles
+                # dots in directory names correctly, unlike str.split('.')
+                base, extension = os.path.splitext(inputFilePath)
                 cipherName = self.__class__.__name__.lower()
                 if mode == 'E':
                     funcName = "encrpyt"
@@ -46,7 +241,7 @@ class Cipher:
                 else:
                     funcName = "unknown"
                 # new file name includes the original name and file extension
-                outputFilePath = f"{temp[0]}.{cipherName}.{funcName}.{temp[-1]}"
+                outputFilePath = f"{base}.{cipherName}.{funcName}{extension}"
 
             return func(self, inputFilePath, outputFilePath, mode, *args, **kwargs)
         return wrapper
@@ -67,29 +262,85 @@ class Cipher:
         """
         raise NotImplementedError
 
+    def encryptRaw(self, data: bytes, *args, **kwargs) -> bytes:
+        """
+        Encrypts normalized bytes (uppercase A-Z only). Subclasses with a
+        fixed substitution table override this with a bytes.translate call;
+        the default falls back to the text implementation.
+        """
+        return self.encryptText(data.decode('ascii'), *args, **kwargs).encode('ascii')
+
+    def decryptRaw(self, data: bytes, *args, **kwargs) -> bytes:
+        """
+        Decrypts normalized bytes (uppercase A-Z only). See encryptRaw.
+        """
+        return self.decryptText(data.decode('ascii'), *args, **kwargs).encode('ascii')
+
     @constructFilePath
     def processFile(self, inputFilePath: str,
                     outputFilePath: Optional[str] = None,
                     mode: str = 'E',
-                    *args, **kwargs) -> str:
+                    *args, wrap: Optional[int] = 80, **kwargs) -> str:
         """
         Handles the input and output for files during the encryption or
         decryption process determined by mode. Takes a filepath for the input
         and an optional filepath to the output, and returns the output filepath.
-        Makes a call to encryptText() or decryptText() for interal logic.
-        """
-        with open(inputFilePath, 'r', encoding='utf-8') as inputFile, \
-            open(outputFilePath, 'w', encoding='utf-8') as outputFile:
-            # grabs input text, encrypts it, and writes it out with line wrapping
-            text = inputFile.read()
-            if mode == 'E':
-                newText = self.encryptText(text, *args, **kwargs)
-            elif mode == 'D':
-                newText = self.decryptText(text, *args, **kwargs)
+        Output lines are wrapped every wrap characters; pass wrap=None to
+        write the output as a single unwrapped line, which is cheaper and
+        simpler to consume for downstream tools that re-normalize anyway.
+        Makes a call to encryptRaw() or decryptRaw() for interal logic.
+        """
+        if wrap is not None and wrap <= 0:
+            # fail loudly like textwrap used to; a zero width would never
+            # advance through the output
+            raise ValueError("wrap must be a positive width or None")
+
+        if mode == 'E':
+            transform = self.encryptRaw
+        elif mode == 'D':
+            transform = self.decryptRaw
+        else:
+            print("invalid mode")
+            return outputFilePath
+
+        with open(inputFilePath, 'rb', buffering=_FILE_BUFFERING) as inputFile, \
+            open(outputFilePath, 'wb', buffering=_FILE_BUFFERING) as outputFile:
+            # binary mode skips the UTF-8 codec on both ends
+            if self.streamable:
+                # process in fixed-size chunks so peak memory stays constant
+                # regardless of file size, carrying the wrap column across
+                fusedTable = (self._fusedEncTable if mode == 'E'
+                              else self._fusedDecTable)
+                col = 0
+                while chunk := inputFile.read(_CHUNK_SIZE):
+                    if fusedTable is not None:
+                        # normalize and encrypt in one translate pass
+                        newData = chunk.translate(fusedTable, _NON_LETTER)
+                    else:
+                        newData = transform(self.normalizeRaw(chunk),
+                                            *args, **kwargs)
+                    if wrap is None:
+                        outputFile.write(newData)
+                    else:
+                        col = _writeWrapped(outputFile, newData, col, wrap)
             else:
-                print("invalid mode")
-            newText = textwrap.wrap(newText, width=80)
-            outputFile.write('\n'.join(newText))
+                # stateful ciphers need the whole message at once; map the
+                # file read-only and normalize window by window off the
+                # mapping, so the raw bytes are never copied in full before
+                # the non-letters are filtered out
+                try:
+                    with mmap.mmap(inputFile.fileno(), 0,
+                                   access=mmap.ACCESS_READ) as mapped:
+                        data = b''.join(
+                            self.normalizeRaw(mapped[i:i + _FILE_BUFFERING])
+                            for i in range(0, len(mapped), _FILE_BUFFERING))
+                except ValueError: # empty files cannot be mapped
+                    data = b''
+                newData = transform(data, *args, **kwargs)
+                if wrap is None:
+                    outputFile.write(newData)
+                else:
+                    _writeWrapped(outputFile, newData, width=wrap)
 
         return outputFilePath
 
@@ -98,8 +349,18 @@ class Atbash(Cipher):
     Class to model a basic Atbash cipher. This cipher simply substitutes letters
     with the corresponding character in the reverse alphabet. A -> Z, B -> Y, etc.
     """
-    def __init__(self):
-        self.alpha = ALPHABET[::-1] # reverse alphabet
+    streamable = True # fixed table, safe to process files in chunks
+
+    # Atbash takes no key, so the alphabet and tables are built once at
+    # class definition and shared by every instance. It is also its own
+    # inverse, so one table covers both directions; the fused variant
+    # additionally folds case and non-letter handling into the same pass.
+    alpha = ALPHABET[::-1] # reverse alphabet
+    _rawEncTable = bytes.maketrans(_ALPHABET_BYTES, alpha.encode('ascii'))
+    _fusedEncTable = bytes.maketrans(
+        (ALPHABET + ALPHABET.lower()).encode('ascii'),
+        alpha.encode('ascii') * 2)
+    _fusedDecTable = _fusedEncTable
 
     @Cipher.normalizeText
     def encryptText(self, text: str) -> str:
@@ -108,12 +369,8 @@ class Atbash(Cipher):
         simply corresponding letters with the equivalent character in the reverse
         alphabet.
         """
-        newText = ""
-        for char in text:
-            index = ALPHABET.index(char) # find index in original alphabet
-            newChar = self.alpha[index] # loolup character from the reverse
-            newText += newChar
-        return newText
+        # normalized input is plain ASCII, so the flat bytes table applies
+        return _substitute(text.encode('ascii'), self._rawEncTable).decode('ascii')
 
     @Cipher.normalizeText
     def decryptText(self, text: str) -> str:
@@ -121,7 +378,15 @@ class Atbash(Cipher):
         Specific implementation of decryption for an Atbash cipher. For Atbash,
         encryption and decryption are equivalent.
         """
-        return self.encryptText(text) # encryption and decryption are the same
+        # same table both directions; applied directly rather than through
+        # encryptText, whose decorator would re-normalize the text
+        return _substitute(text.encode('ascii'), self._rawEncTable).decode('ascii')
+
+    def encryptRaw(self, data: bytes) -> bytes:
+        return _substitute(data, self._rawEncTable)
+
+    def decryptRaw(self, data: bytes) -> bytes:
+        return _substitute(data, self._rawEncTable) # same table both directions
 
 class Caesar(Cipher):
     """
@@ -129,14 +394,17 @@ class Caesar(Cipher):
     with the corresponding character in a shifted alphabet. A shift of 3
     represents adding 3 to the index of each letter. A -> D, B -> E, etc.
     """
+    streamable = True # fixed table, safe to process files in chunks
+
     def __init__(self, shift: int = 13):
         # adjusts the shifts to be in bounds
         # works with large and negative numbers
         # shift defaults to 13
         shift = shift % len(ALPHABET)
-        # slice and rejoin at shift index
-        # alphabet restarts with A after Z
-        self.alpha = ALPHABET[shift:] + ALPHABET[:shift]
+        # the alphabet and tables only depend on the shift, so they come
+        # from the per-shift cache rather than being rebuilt per instance
+        (self.alpha, self._rawEncTable, self._rawDecTable,
+         self._fusedEncTable, self._fusedDecTable) = _caesarTables(shift)
 
     @Cipher.normalizeText
     def encryptText(self, text: str) -> str:
@@ -145,13 +413,8 @@ class Caesar(Cipher):
         simply substitutes letters with the corresponding character in a shifted
         alphabet. A shift of 3 represents adding 3 to the index of each letter.
         """
-        newText = ""
-        for char in text:
-            # simple substitution between original and shifted alphabet
-            index = ALPHABET.index(char)
-            newChar = self.alpha[index]
-            newText += newChar
-        return newText
+        # normalized input is plain ASCII, so the flat bytes table applies
+        return _substitute(text.encode('ascii'), self._rawEncTable).decode('ascii')
 
     @Cipher.normalizeText
     def decryptText(self, text: str) -> str:
@@ -159,13 +422,13 @@ class Caesar(Cipher):
         Specific implementation of decryption for an Caesar cipher. This cipher
         simply unshifts the letters that were shifted during encryption.
         """
-        newText = ""
-        for char in text:
-            # simple substitution back from shifted alphabet to original
-            index = self.alpha.index(char)
-            newChar = ALPHABET[index]
-            newText += newChar
-        return newText
+        return _substitute(text.encode('ascii'), self._rawDecTable).decode('ascii')
+
+    def encryptRaw(self, data: bytes) -> bytes:
+        return _substitute(data, self._rawEncTable)
+
+    def decryptRaw(self, data: bytes) -> bytes:
+        return _substitute(data, self._rawDecTable)
 
 class TabulaRecta(Cipher):
     """
@@ -177,6 +440,18 @@ class TabulaRecta(Cipher):
     def __init__(self, shift: int = 0):
         self.offset(shift)
         self.defaultShift = shift
+        # all 26 rows of the table as translation tables (26 x 256 bytes),
+        # one per rotation, so any row is a single lookup away
+        self._rawTables = tuple(
+            bytes.maketrans(_ALPHABET_BYTES,
+                            (ALPHABET[s:] + ALPHABET[:s]).encode('ascii'))
+            for s in range(len(ALPHABET)))
+        if numpy is not None:
+            # the same tables stacked as a 26x256 matrix (6.6 KB, sits in
+            # L1) so encryption becomes a single fancy-index gather
+            self._tableMatrix = numpy.stack(
+                [numpy.frombuffer(t, dtype=numpy.uint8)
+                 for t in self._rawTables])
 
     def offset(self, shift: int = 0) -> None:
         """
@@ -184,9 +459,10 @@ class TabulaRecta(Cipher):
         beginning of encrypt or decrypt. Necessary for a successful decryption.
         A shift of 0 is the same as beginning with an ordinary alphabet.
         """
-        # borrowed from Caesar
-        shift = shift % len(ALPHABET)
-        self.alpha = ALPHABET[shift:] + ALPHABET[:shift]
+        # the rotated alphabet is fully determined by its rotation amount,
+        # so only the integer is tracked and no string is ever rebuilt
+        # works with large and negative numbers
+        self.alphaOffset = shift % len(ALPHABET)
 
     def rotate(self, step: int = 1) -> None:
         """
@@ -194,14 +470,9 @@ class TabulaRecta(Cipher):
         in the table. Step represents the number of rows down or column over from
         the current row. Step can be any integer.
         """
-        # adjusts the step to be in bounds
-        # works with large and negative numbers
-        step = step % len(ALPHABET)
-
-        # step must be a non-zero integer
-        if step != 0:
-            newAlpha = self.alpha[step:] + self.alpha[:step]
-            self.alpha = newAlpha
+        # advancing a row is a constant-time integer add instead of a
+        # 26-byte slice-and-copy of the alphabet
+        self.alphaOffset = (self.alphaOffset + step) % len(ALPHABET)
 
     @Cipher.normalizeText
     def encryptText(self, text: str, shift: int = 0, step: int = 1) -> str:
@@ -214,19 +485,20 @@ class TabulaRecta(Cipher):
         #set the initial position of the table
         self.offset(shift or self.defaultShift)
 
-        newText = ""
+        # work on locals inside the loop; each substitution is the current
+        # offset added to the letter index, modulo the alphabet
+        off = self.alphaOffset
+        step = step % len(ALPHABET)
+        newChars = []
         for char in text:
-            # performs a simple substitution with the tabula row
-            index = ALPHABET.index(char)
-            newChar = self.alpha[index]
-            newText += newChar
+            newChars.append(chr((ord(char) - 65 + off) % 26 + 65))
             # the alphabet is rotated by 1 after every letter
             # equivalent to 26 different Caesar ciphers
-            self.rotate(step)
+            off = (off + step) % 26
 
         # reset the cipher to its default state
         self.offset(self.defaultShift)
-        return newText
+        return ''.join(newChars)
 
     @Cipher.normalizeText
     def decryptText(self, text: str, shift: int = None, step: int = 1) -> str:
@@ -239,6 +511,37 @@ class TabulaRecta(Cipher):
         # encrypt but with opposite params
         return self.encryptText(text, -shift or -self.defaultShift, -step)
 
+    def encryptRaw(self, data: bytes, shift: int = 0, step: int = 1) -> bytes:
+        """
+        Bytes-path encryption using the precomputed rotation tables. The
+        rotation repeats with period 26/gcd(step, 26), so the message is
+        split into that many strided subsequences, each sharing one rotation,
+        and every subsequence is translated in a single C-level pass.
+        """
+        shift = (shift or self.defaultShift) % len(ALPHABET)
+        step = step % len(ALPHABET)
+
+        if numpy is not None and len(data) >= _VECTOR_MIN:
+            # every position's rotation is known upfront, so the whole
+            # message is one table gather: tables[offset[i], byte[i]]
+            codes = numpy.frombuffer(data, dtype=numpy.uint8)
+            offsets = (shift + step * numpy.arange(codes.size)) % len(ALPHABET)
+            return self._tableMatrix[offsets, codes].tobytes()
+
+        period = len(ALPHABET) // gcd(step, len(ALPHABET))
+        out = bytearray(len(data))
+        for r in range(period):
+            table = self._rawTables[(shift + step * r) % len(ALPHABET)]
+            out[r::period] = _substitute(data[r::period], table)
+        return bytes(out)
+
+    def decryptRaw(self, data: bytes, shift: int = None, step: int = 1) -> bytes:
+        """
+        Bytes-path decryption; encryption with the opposite parameters,
+        mirroring decryptText.
+        """
+        return self.encryptRaw(data, -(shift or self.defaultShift), -step)
+
 class AutoKey(Cipher):
     """
     Class to model an autokey cipher. The encryption incorporates a primer and
@@ -255,17 +558,16 @@ class AutoKey(Cipher):
         determined by taking a short primer keyword and appending the plaintext
         message. The key is used to shift each letter of the message.
         """
+        # the primer gets the same normalization as the message, so every
+        # code path sees the same A-Z key stream
+        primer = self.normalizeString(primer)
+        if not primer:
+            raise ValueError("primer must contain at least one letter")
+
         # key will be slightly longer than the message itself due to the primer
+        # the whole key stream is known upfront, unlike decryption
         key = primer + text
-        newText = ""
-        for char, k in zip(text, key):
-            # get the character index of the message and the key
-            index1 = ALPHABET.index(char)
-            index2 = ALPHABET.index(k)
-            # the new character is the original char shifted by the key char
-            newChar = ALPHABET[(index1 + index2) % 26]
-            newText += newChar
-        return newText
+        return _shiftByKey(text, key, +1)
 
     @Cipher.normalizeText
     def decryptText(self, text, primer):
@@ -274,18 +576,34 @@ class AutoKey(Cipher):
         reverses the shifts done during encrypting by subtracting the indexes
         instead of adding. The key is dynamically build from the decrypted text.
         """
+        # the primer gets the same normalization as the message, so every
+        # code path sees the same A-Z key stream
+        primer = self.normalizeString(primer)
+        if not primer:
+            raise ValueError("primer must contain at least one letter")
+
+        if numba is not None:
+            # hand the sequential loop to the compiled kernel
+            data = numpy.frombuffer(text.encode('ascii'),
+                                    dtype=numpy.uint8).astype(numpy.int16)
+            primerData = numpy.frombuffer(primer.encode('ascii'),
+                                          dtype=numpy.uint8).astype(numpy.int16)
+            out = numpy.empty(data.size, dtype=numpy.int16)
+            _autokeyDecryptKernel(data, primerData, out)
+            return out.astype(numpy.uint8).tobytes().decode('ascii')
+
         # full key must be built continuously as the text is decrypted
-        key = primer
-        newText = ""
+        key = list(primer)
+        newChars = []
         for i, char in enumerate(text):
-            index1 = ALPHABET.index(char)
-            index2 = ALPHABET.index(key[i])
+            index1 = _ALPHA_INDEX[ord(char)]
+            index2 = _ALPHA_INDEX[ord(key[i])]
             # subtract instead of add
             newChar = ALPHABET[(index1 - index2) % 26]
             # add the decrypted char to the end of the key
-            key += newChar
-            newText += newChar
-        return newText
+            key.append(newChar)
+            newChars.append(newChar)
+        return ''.join(newChars)
 
 class Vigenere(Cipher):
     """
@@ -303,15 +621,14 @@ class Vigenere(Cipher):
         key and shifts each letter of the message by the index of the next letter
         in the key. The key is repeated when it runs out of new characters.
         """
-        newText = ""
-        for i, char in enumerate(text):
-            # get the character index of the message and the key
-            index1 = ALPHABET.index(char)
-            index2 = ALPHABET.index(key[i % len(key)])
-            # add the indexes to encrypt
-            newChar = ALPHABET[(index1 + index2) % 26]
-            newText += newChar
-        return newText
+        # the key gets the same normalization as the message, per the
+        # key-shift helper's A-Z contract
+        key = self.normalizeString(key)
+        if not key:
+            raise ValueError("key must contain at least one letter")
+
+        # add the key letter to each message letter to encrypt
+        return _shiftByKey(text, key, +1)
 
     @Cipher.normalizeText
     def decryptText(self, text: str, key: str) -> str:
@@ -320,15 +637,15 @@ class Vigenere(Cipher):
         reverses the shifts done during encrypting by subtracting the indexes
         instead of adding. Again, the key is repeated as necessary.
         """
-        newText = ""
+        # the key gets the same normalization as the message, per the
+        # key-shift helper's A-Z contract
+        key = self.normalizeString(key)
+        if not key:
+            raise ValueError("key must contain at least one letter")
+
         # essentially the same as encryption
-        for i, char in enumerate(text):
-            index1 = ALPHABET.index(char)
-            index2 = ALPHABET.index(key[i % len(key)])
-            # subtract instead of add to undo
-            newChar = ALPHABET[(index1 - index2) % 26]
-            newText += newChar
-        return newText
+        # subtract instead of add to undo
+        return _shiftByKey(text, key, -1)
 
 if __name__ == "__main__":
     # unit tests for each implemented cipher